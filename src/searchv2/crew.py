@@ -1,13 +1,70 @@
-from crewai import Agent, Crew, Process, Task
-from crewai.project import CrewBase, agent, crew, task, tool
+import asyncio
+import functools
+import os
+
+from concurrent.futures import ThreadPoolExecutor
+
+from crewai import LLM, Agent, Crew, CrewOutput, Process, Task
+from crewai.project import CrewBase, agent, crew, llm, task, tool
+from crewai.types.usage_metrics import UsageMetrics
+from crewai.utilities import RPMController
+from crewai.utilities.llm_utils import create_llm
 from crewai.agents.agent_builder.base_agent import BaseAgent
-from typing import List
+from typing import Any, Dict, List
 from searchv2.tools.human_input_tool import HumanInputTool
 from crewai_tools import WebsiteSearchTool
 # If you want to run a snippet of code before or after the crew starts,
 # you can use the @before_kickoff and @after_kickoff decorators
 # https://docs.crewai.com/concepts/crews#example-crew-class-with-decorators
 
+# Step-by-step agent traces are printed synchronously on every turn; keep
+# them off unless explicitly asked for.
+VERBOSE = os.getenv("CREWAI_VERBOSE", "").lower() in ("1", "true", "yes")
+
+# Upper bound on crews kicked off at once by MedicalSearch.run_many (at least 1)
+MAX_PARALLEL_PATIENTS = max(1, int(os.getenv("MAX_PARALLEL_PATIENTS", "8")))
+
+# Requests-per-minute cap; one limiter is shared by all agents of a crew, and
+# by all crew copies of one MedicalSearch.run_many batch
+MAX_RPM = int(os.getenv("MAX_RPM", "0")) or None
+
+
+# WebsiteSearchTool (embedchain) settings: Gemini for answers, local MiniLM
+# for embeddings
+_WEBSITE_SEARCH_CONFIG = dict(
+    llm=dict(
+        provider="google",  # or google, openai, anthropic, llama2, ...
+        config=dict(
+            model="gemini/gemini-2.0-flash-001",
+            # temperature=0.5,
+            # top_p=1,
+            # stream=true,
+        ),
+    ),
+    embedder=dict(
+        provider="huggingface",  # local sentence-transformers, no API round trip
+        config=dict(
+            model="sentence-transformers/all-MiniLM-L6-v2",
+        ),
+    ),
+    vectordb=dict(
+        provider="chroma",
+        config=dict(
+            # MiniLM vectors are 384-d; keep them apart from the
+            # 768-d embedding-001 collection already in db/
+            collection_name="searchv2_minilm",
+            dir="db",
+        ),
+    ),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_website_search_tool() -> WebsiteSearchTool:
+    # Building the tool loads the embedder and opens the Chroma store, so
+    # one instance is shared by every MedicalSearch crew in the process
+    return WebsiteSearchTool(config=_WEBSITE_SEARCH_CONFIG)
+
 
 @CrewBase
 class MedicalSearch():
@@ -23,41 +80,28 @@ class MedicalSearch():
     # If you would like to add tools to your agents, you can learn more about it here:
     # https://docs.crewai.com/concepts/agents#agent-tools
 
+    # One LLM instance shared by every agent (wired up via `llm:` in agents.yaml),
+    # resolved from MODEL / BASE_URL etc. exactly as an agent without `llm:` would be
+    @llm
+    def default_llm(self) -> LLM:
+        return create_llm(None)
+
     # Communicator agent: interacts with user, extracts symptoms, calls search agent as needed
 
     @tool
-    def WebsiteSearchTool(self):
-        from crewai_tools import WebsiteSearchTool
-        return WebsiteSearchTool(
-        config=dict(
-            llm=dict(
-                provider="google",  # or google, openai, anthropic, llama2, ...
-                config=dict(
-                    model="gemini/gemini-2.0-flash-001",
-                    # temperature=0.5,
-                    # top_p=1,
-                    # stream=true,
-                ),
-            ),
-            embedder=dict(
-                provider="google",  # or openai, ollama, ...
-                config=dict(
-                    model="models/embedding-001",
-                    task_type="retrieval_document",
-                    # title="Embeddings",
-                ),
-            ),
-        )
-    )
-    
+    def website_search_tool(self):
+        return _shared_website_search_tool()
 
+    @tool
+    def human_input_tool(self):
+        return HumanInputTool()
 
     @agent
     def communicator(self) -> Agent:
         return Agent(
             config=self.agents_config['communicator'],
-            verbose=True,
-            tools=[HumanInputTool()],
+            verbose=VERBOSE,
+            tools=[self.human_input_tool()],
             force_tool_output=False,
         )
     # Main user-facing task
@@ -79,7 +123,7 @@ class MedicalSearch():
     def search_agent(self) -> Agent:
         return Agent(
             config=self.agents_config['search_agent'],
-            verbose=True,
+            verbose=VERBOSE,
         )
 
     @crew
@@ -92,5 +136,48 @@ class MedicalSearch():
             agents=self.agents,
             tasks=self.tasks,
             process=Process.sequential,
-            verbose=True,
+            verbose=VERBOSE,
+            max_rpm=MAX_RPM,
         )
+
+    async def run_many(self, inputs: List[Dict[str, Any]]) -> List[CrewOutput]:
+        """
+        Run an independent copy of the crew for each input (e.g. one per patient).
+
+        Copies run on a dedicated pool of MAX_PARALLEL_PATIENTS threads, so at
+        most that many crews are in flight regardless of the default executor.
+        Only for inputs that need no follow-up questions: the communicator's
+        HumanInputTool reads stdin, so concurrent copies would race for it.
+        All copies draw from one MAX_RPM budget, and token usage of all copies
+        is summed into crew.usage_metrics.
+        """
+        crew = self.crew()
+        copies = [crew.copy() for _ in inputs]
+        loop = asyncio.get_running_loop()
+
+        # Crew.copy() gives every copy its own RPMController, which would
+        # multiply MAX_RPM by the number of crews in flight; point all copied
+        # agents at one controller for the whole batch instead
+        rpm_controller = RPMController(max_rpm=MAX_RPM) if MAX_RPM else None
+        if rpm_controller:
+            for copy in copies:
+                for copied_agent in copy.agents:
+                    copied_agent._rpm_controller = rpm_controller
+
+        try:
+            with ThreadPoolExecutor(max_workers=MAX_PARALLEL_PATIENTS) as executor:
+                results = await asyncio.gather(*(
+                    loop.run_in_executor(executor, copy.kickoff, patient_inputs)
+                    for copy, patient_inputs in zip(copies, inputs)
+                ))
+        finally:
+            if rpm_controller:
+                rpm_controller.stop_rpm_counter()
+
+        total_usage_metrics = UsageMetrics()
+        for copy in copies:
+            if copy.usage_metrics:
+                total_usage_metrics.add_usage_metrics(copy.usage_metrics)
+        crew.usage_metrics = total_usage_metrics
+        crew._task_output_handler.reset()
+        return results
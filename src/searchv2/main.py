@@ -1,11 +1,11 @@
 #!/usr/bin/env python
 import sys
+import threading
 import warnings
 
+from concurrent.futures import Future
 from datetime import datetime
 
-from searchv2.crew import MedicalSearch
-from crewai_tools import WebsiteSearchTool
 from dotenv import load_dotenv
 load_dotenv(dotenv_path="medical_search/.env")
 
@@ -21,10 +21,21 @@ def run():
     """
     Run the crew in a user-in-the-loop interactive mode: the agent reasons and asks follow-up questions, but only the user answers them.
     """
-    crew = MedicalSearch().crew()
+    # Import and build the crew (crewAI import, embedder load, Chroma open)
+    # while the user is typing
+    crew_future = _start_crew_build()
     context = {}
     print("Welcome to the Medical Symptom Communicator!")
+    # Don't ask for symptoms if setup has already failed (e.g. a bad env value)
+    if crew_future.done() and crew_future.exception():
+        print(f"Failed to set up the crew: {crew_future.exception()}")
+        return
     user_input = input("Please describe your symptoms: ")
+    try:
+        crew = crew_future.result()
+    except Exception as e:
+        print(f"Failed to set up the crew: {e}")
+        return
     while True:
         # Pass the user input as the topic for the agent
         inputs = {'topic': user_input}
@@ -52,3 +63,23 @@ def run():
             print(result)
             break
 
+
+def _build_crew():
+    # Deferred so importing this module does not pull in crewAI and its
+    # tool stack up front
+    from searchv2.crew import MedicalSearch
+    return MedicalSearch().crew()
+
+
+def _start_crew_build() -> Future:
+    # Daemon thread, so Ctrl+C at the first prompt is not held up by the build
+    future = Future()
+
+    def build():
+        try:
+            future.set_result(_build_crew())
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=build, daemon=True).start()
+    return future
@@ -1 +0,0 @@
-from crewai_tools import WebsiteSearchTool
\ No newline at end of file
@@ -1,3 +1,5 @@
+import functools
+
 from crewai.tools import BaseTool
 from typing import Type, List, Dict, Optional
 from pydantic import BaseModel, Field
@@ -11,6 +13,12 @@ except ImportError:
     Translator = None
 
 
+@functools.lru_cache(maxsize=None)
+def _get_translator():
+    # One long-lived client so repeated translations reuse its HTTP connection
+    return Translator()
+
+
 class CommunicatorInput(BaseModel):
     user_input: str = Field(...,
                             description="User's message or symptom description.")
@@ -28,9 +36,9 @@ class CommunicatorTool(BaseTool):
     args_schema: Type[BaseModel] = CommunicatorInput
 
     def _run(self, user_input: str, follow_up_questions: Optional[List[str]] = None, context: Optional[Dict] = None) -> Dict:
-        # Detect language
+        # Detect language; replies with no letters ("3", "7/10") carry none
         lang = 'en'
-        if detect:
+        if detect and any(c.isalpha() for c in user_input):
             try:
                 lang = detect(user_input)
             except Exception:
@@ -39,8 +47,7 @@ class CommunicatorTool(BaseTool):
         processed_input = user_input
         if lang == 'tr' and Translator:
             try:
-                translator = Translator()
-                processed_input = translator.translate(
+                processed_input = _get_translator().translate(
                     user_input, src='tr', dest='en').text
             except Exception:
                 processed_input = user_input